@@ -0,0 +1,179 @@
+"""Tables and lookup indexes behind :mod:`pokedex.my_module`.
+
+Every CSV is loaded exactly once per process (through the Parquet cache in
+:mod:`pokedex.data_cache`) and the dict/array indexes used by the lookups are
+built right after. Loading is deferred to the first access of one of those
+names (PEP 562 ``__getattr__``), so importing this module -- and pandas -- is
+cheap. Use qualified names (``_data.POKEMON_BY_ID``) rather than copying the
+tables around.
+"""
+
+import functools
+import math
+import threading
+from collections import deque
+
+# Narrow ids and categorical identifiers (for the columns that are never empty)
+DTYPES = {
+    "id": "int32",
+    "species_id": "int32",
+    "pokemon_id": "int32",
+    "pokemon_species_id": "int32",
+    "type_id": "int16",
+    "stat_id": "int8",
+    "base_stat": "int16",
+    "version_id": "int16",
+    "language_id": "int16",
+    "local_language_id": "int16",
+    "identifier": "category",
+}
+
+# Base stats are returned under these keys, for stat ids 1..6
+STAT_KEYS = ("HP", "Atk", "Def", "SpA", "SpD", "Spe")
+
+# Names built by _load() on first access; any other missing attribute is a plain AttributeError
+_LAZY_NAMES = frozenset({
+    "pokemon_df", "pokemon_species_df", "pokemon_types_df", "pokemon_stats_df",
+    "pokemon_species_flavor_text_df", "versions_df", "pokemon_species_names_df",
+    "SPECIES_BY_ID", "POKEMON_BY_ID", "SPECIES_NAME_TO_ID", "POKEMON_NAME_TO_ID", "FORMS_BY_SPECIES",
+    "NAME_BY_LANG", "VERSION_NAME_BY_ID", "FLAVOR_BY_LANG_SPECIES", "TYPES_BY_POKEMON",
+    "STATS_MATRIX", "POKEMON_ID_TO_ROW", "SPRITE_PATH", "HOME_SPRITE_PATH", "CRY_PATH",
+    "CHILDREN", "EVO_ROOT_BY_CHAIN", "EVO_ORDER_BY_CHAIN",
+})
+# Serializes the first load: get_pokemon_many and the Qt workers may all arrive at once
+_LOAD_LOCK = threading.Lock()
+
+
+def _evolution_graph(pokemon_species_df):
+    # (species id -> sorted ids it evolves into, evolution_chain_id -> first-stage species id)
+    children = {}
+    roots = {}
+    columns = ["id", "evolves_from_species_id", "evolution_chain_id"]
+    for species_id, parent_id, chain_id in pokemon_species_df[columns].itertuples(index=False):
+        if math.isnan(parent_id):  # first stage of its chain
+            chain_id = int(chain_id)
+            roots[chain_id] = min(roots.get(chain_id, species_id), species_id)
+        else:
+            children.setdefault(int(parent_id), []).append(int(species_id))
+    children = {parent_id: tuple(sorted(ids)) for parent_id, ids in children.items()}
+    return children, {chain_id: int(root_id) for chain_id, root_id in roots.items()}
+
+
+def _evolution_order(children, root_id):
+    # species ids of a chain, root first then breadth-first (siblings by id)
+    queue = deque([root_id])
+    order = []
+    while queue:
+        current_id = queue.popleft()
+        order.append(current_id)
+        queue.extend(children.get(current_id, ()))
+    return order
+
+
+@functools.cache
+def _load():
+    """Load the tables and build the indexes.
+
+    Returns:
+        A dict with every lazily loaded name of this module.
+    """
+    from pokedex import data_cache  # imports pandas
+
+    pokemon_df = data_cache.load("pokemon", dtype=DTYPES)
+    pokemon_species_df = data_cache.load("pokemon_species", dtype=DTYPES)
+
+    pokemon_types_df = data_cache.load("pokemon_types", dtype=DTYPES)
+
+    pokemon_stats_df = data_cache.load("pokemon_stats", dtype=DTYPES)
+
+    # largest table: only materialize the columns get_pokedex_flavor reads
+    pokemon_species_flavor_text_df = data_cache.load(
+        "pokemon_species_flavor_text", columns=["species_id", "version_id", "language_id", "flavor_text"],
+        dtype=DTYPES,
+    )
+    versions_df = data_cache.load("versions", dtype=DTYPES)
+    pokemon_species_names_df = data_cache.load("pokemon_species_names", dtype=DTYPES)  # for localized names
+
+    # lowercased identifier -> id (lowercased once here instead of per call)
+    species_name_to_id = dict(zip(pokemon_species_df["identifier"].str.lower(), pokemon_species_df["id"].astype(int)))
+    pokemon_name_to_id = dict(zip(pokemon_df["identifier"].str.lower(), pokemon_df["id"].astype(int)))
+
+    # local_language_id -> {species id: localized name}
+    name_by_lang = {}
+    for species_id, language_id, name in pokemon_species_names_df[
+        ["pokemon_species_id", "local_language_id", "name"]
+    ].itertuples(index=False):
+        name_by_lang.setdefault(int(language_id), {}).setdefault(int(species_id), name)
+
+    # (language_id, species_id) -> ([version ids], [flavor texts]), in table order
+    flavor_by_lang_species = {}
+    for species_id, version_id, language_id, text in pokemon_species_flavor_text_df[
+        ["species_id", "version_id", "language_id", "flavor_text"]
+    ].itertuples(index=False):
+        entry = flavor_by_lang_species.setdefault((int(language_id), int(species_id)), ([], []))
+        entry[0].append(int(version_id))
+        entry[1].append(text)
+
+    # Base stats as a dense (n_pokemon, 6) int16 matrix; columns are stat ids 1..6
+    stats_pivot = (
+        pokemon_stats_df.pivot(index="pokemon_id", columns="stat_id", values="base_stat")
+        .reindex(columns=range(1, len(STAT_KEYS) + 1))
+        .fillna(0)
+        .astype("int16")
+    )
+
+    children, evo_root_by_chain = _evolution_graph(pokemon_species_df)
+
+    species_by_id = pokemon_species_df.set_index("id")
+    pokemon_by_id = pokemon_df.set_index("id")
+    # pandas fills an index's hash table on its first lookup, and that isn't thread-safe:
+    # do it here, under _LOAD_LOCK, rather than in whichever workers get there first
+    for df in (species_by_id, pokemon_by_id):
+        if len(df.index):
+            df.index.get_loc(df.index[0])
+
+    # asset paths formatted once per pokemon id (ids jump to 10001+ for forms, hence dicts)
+    pokemon_ids = [int(pid) for pid in pokemon_df["id"]]
+
+    return {
+        "pokemon_df": pokemon_df,
+        "pokemon_species_df": pokemon_species_df,
+        "pokemon_types_df": pokemon_types_df,
+        "pokemon_stats_df": pokemon_stats_df,
+        "pokemon_species_flavor_text_df": pokemon_species_flavor_text_df,
+        "versions_df": versions_df,
+        "pokemon_species_names_df": pokemon_species_names_df,
+        # Indexes, so lookups by id don't scan whole tables
+        "SPECIES_BY_ID": species_by_id,
+        "POKEMON_BY_ID": pokemon_by_id,
+        "SPECIES_NAME_TO_ID": species_name_to_id,
+        "POKEMON_NAME_TO_ID": pokemon_name_to_id,
+        "FORMS_BY_SPECIES": pokemon_df.groupby("species_id", sort=False)["identifier"].apply(tuple).to_dict(),
+        "NAME_BY_LANG": name_by_lang,
+        "VERSION_NAME_BY_ID": dict(zip(versions_df["id"].astype(int), versions_df["identifier"].astype(str))),
+        "FLAVOR_BY_LANG_SPECIES": flavor_by_lang_species,
+        "TYPES_BY_POKEMON": (
+            pokemon_types_df.sort_values("slot").groupby("pokemon_id")["type_id"].apply(tuple).to_dict()
+        ),
+        "STATS_MATRIX": stats_pivot.to_numpy(),
+        "POKEMON_ID_TO_ROW": {int(pid): row for row, pid in enumerate(stats_pivot.index)},
+        "SPRITE_PATH": {pid: f"data/sprites/sprites/pokemon/{pid}.png" for pid in pokemon_ids},
+        "HOME_SPRITE_PATH": {pid: f"data/sprites/sprites/pokemon/other/home/{pid}.png" for pid in pokemon_ids},
+        "CRY_PATH": {pid: f"data/cries/cries/pokemon/latest/{pid}.ogg" for pid in pokemon_ids},
+        "CHILDREN": children,
+        "EVO_ROOT_BY_CHAIN": evo_root_by_chain,
+        "EVO_ORDER_BY_CHAIN": {
+            chain_id: _evolution_order(children, root_id) for chain_id, root_id in evo_root_by_chain.items()
+        },
+    }
+
+
+def __getattr__(name):
+    # first access loads everything; later lookups hit the module globals directly
+    if name not in _LAZY_NAMES:  # e.g. pytest_plugins, __path__: never worth a load
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _LOAD_LOCK:
+        # checked again under the lock: another thread may have finished the load meanwhile
+        if name not in globals():
+            globals().update(_load())
+    return globals()[name]
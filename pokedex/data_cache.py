@@ -0,0 +1,63 @@
+"""Parquet cache for the CSV tables under ``data/csv``.
+
+The first load of a table parses the CSV and writes ``data/cache/<name>.parquet``;
+later loads read the typed, columnar Parquet file instead (memory-mapped, so the
+OS page cache backs the reads), which is much faster than tokenizing the CSV
+again. The cache is rebuilt whenever the CSV is newer.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+CSV_DIR = Path("data/csv")
+CACHE_DIR = Path("data/cache")
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return -1.0
+
+
+def _astype(df: pd.DataFrame, dtype: dict[str, str] | None) -> pd.DataFrame:
+    # no-op for caches written with these dtypes; converts caches from older runs
+    if not dtype:
+        return df
+    return df.astype({col: t for col, t in dtype.items() if col in df.columns}, copy=False)
+
+
+def load(name: str, columns: list[str] | None = None,
+         dtype: dict[str, str] | None = None) -> pd.DataFrame:
+    """Load ``data/csv/<name>.csv`` through its Parquet cache.
+
+    Args:
+        name: Table name, without directory or extension.
+        columns: If given, only these columns are materialized.
+        dtype: Column dtypes to parse with (e.g. ``"int16"``, ``"string[pyarrow]"``).
+            Parquet keeps them, so cached loads come back already typed.
+
+    Returns:
+        The table as a DataFrame.
+    """
+    csv_path = CSV_DIR / f"{name}.csv"
+    parquet_path = CACHE_DIR / f"{name}.parquet"
+
+    if not csv_path.exists() or _mtime(parquet_path) >= _mtime(csv_path):
+        try:
+            df = pd.read_parquet(parquet_path, columns=columns, engine="pyarrow", memory_map=True)
+            return _astype(df, dtype)
+        except (OSError, ValueError, ImportError):
+            pass  # missing or unreadable cache: rebuild it from the CSV
+
+    df = pd.read_csv(csv_path, dtype=dtype)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = parquet_path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, engine="pyarrow", index=False)
+        os.replace(tmp_path, parquet_path)
+    except (OSError, ValueError, ImportError):
+        pass  # caching is best-effort
+    return df[columns] if columns is not None else df
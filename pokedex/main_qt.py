@@ -3,95 +3,635 @@ Pokedex page using PySide6.
 
 This file expects pokedex.my_module.typed_function to expose:
 - get_pokemon(identifier: str, form: str | None = None, language_id: int = 9) -> dict
-  returning keys: name, dex_number, image, cries (list[str]), types (list[str]),
+  returning keys: name, dex_number, image, cries (list[str]), types (list[int], type ids),
   base_stats (dict[str,int]), evolution_line (list[dict{name,image}]), forms (list[str]|optional)
 - (optional) get_available_forms(identifier) -> list[str]
 - (optional) get_pokedex_flavor(identifier: str, language_id: int = 9)
   returning {"versions": list, "flavor_texts": list}
 """
 
-import sys
+import csv
+import functools
+import hashlib
+import json
 import os
-from typing import List, Tuple
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import List, Tuple
 
-import requests
-import pandas as pd
-from PySide6.QtCore import Qt, QSize, QUrl, QStringListModel
-from PySide6.QtGui import QPixmap, QIcon
+import shiboken6
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSettings,
+    QSize,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import QIcon, QImage, QImageIOHandler, QImageReader, QPixmap
+from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+from PySide6.QtNetwork import (
+    QNetworkAccessManager,
+    QNetworkDiskCache,
+    QNetworkInformation,
+    QNetworkReply,
+    QNetworkRequest,
+)
 from PySide6.QtWidgets import (
     QApplication,
+    QComboBox,
     QCompleter,
-    QWidget,
-    QLabel,
-    QPushButton,
-    QVBoxLayout,
-    QHBoxLayout,
+    QFrame,
     QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
     QLineEdit,
-    QScrollArea,
-    QFrame,
     QMessageBox,
-    QComboBox,
+    QPushButton,
+    QScrollArea,
     QSizePolicy,
-    QGroupBox,
     QToolButton,
+    QVBoxLayout,
+    QWidget,
 )
 
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from pokedex.my_module import typed_function as api  # your data provider
 
-# ---- CSVs for language metadata (used only for the language buttons) ---------
-language_names_df = pd.read_csv("data/csv/language_names.csv")
-languages_df = pd.read_csv("data/csv/languages.csv")
-pokemon_species_df = pd.read_csv("data/csv/pokemon_species.csv")
-pokemon_species_names_df = pd.read_csv("data/csv/pokemon_species_names.csv") # for localized names
+try:
+    import orjson  # optional: much faster (de)serialization for the pokemon cache
+except ImportError:
+    orjson = None
+
+# ---- CSVs for language metadata (language buttons + autocomplete) -----------
+# Small tables, read with the csv module on first use (see the functools.cache'd
+# helpers below); pandas isn't needed for this.
+
+def _read_csv(name: str) -> list[dict[str, str]]:
+    with open(f"data/csv/{name}.csv", newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent  # Final-Project/
 TYPE_ICON_DIR = BASE_DIR / "data" / "sprites" / "sprites" / "types" / "generation-ix" / "scarlet-violet"
-
+# ---- On-disk HTTP cache for remote sprites (QNetworkDiskCache) ---------------
+HTTP_CACHE_DIR = BASE_DIR / ".cache" / "http"
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# Sprite downloads answered with one of these are retried with exponential backoff
+HTTP_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+HTTP_RETRY_MAX = 3
+HTTP_RETRY_BACKOFF_MS = 300
+
+# ---- On-disk cache of api.get_pokemon results --------------------------------
+POKEMON_CACHE_PATH = BASE_DIR / ".cache" / "pokemon.sqlite3"
+POKEMON_CACHE_TTL = 7 * 24 * 3600  # seconds
+# Bump whenever the shape of api.get_pokemon results changes: older rows are dropped
+POKEMON_CACHE_SCHEMA = 2
+POKEMON_CACHE_CSV_DIR = Path("data/csv")
+
+# ---- Startup warm-up: recently loaded Pokémon (persisted with QSettings) ------
+RECENT_MAX = 30
+# Entries are dex numbers (as str), like the ones _remember_recent stores
+RECENT_DEFAULT = [
+    "1", "4", "7", "25", "133", "6",  # bulbasaur, charmander, squirtle, pikachu, eevee, charizard
+    "3", "9", "150", "151", "143", "94",  # venusaur, blastoise, mewtwo, mew, snorlax, gengar
+    "130", "149", "131", "39", "54", "52",  # gyarados, dragonite, lapras, jigglypuff, psyduck, meowth
+    "129", "197", "249", "250", "257", "282",  # magikarp, umbreon, lugia, ho-oh, blaziken, gardevoir
+    "384", "448", "445", "658", "778", "700",  # rayquaza, lucario, garchomp, greninja, mimikyu, sylveon
+]
+
+# ---- In-memory cache of decoded + scaled pixmaps, keyed by (source, w, h, dpr) ----
+_PIXMAP_CACHE: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+_PIXMAP_MAX = 256
+# Thumbnails smaller than this (in device pixels) skip SmoothTransformation entirely
+SMOOTH_MIN_PX = 128
+# Main sprite box (lbl_sprite); prefetched sprites are cached at this size
+SPRITE_SIZE = QSize(256, 256)
+# Remote images are keyed by content digest rather than URL (see _content_digest)
+_URL_TO_DIGEST: dict[str, bytes] = {}
 
 
 # ---- Helpers -----------------------------------------------------------------
 
-def _load_pixmap(path_or_url: str, max_size: QSize | None = QSize(256, 256)) -> QPixmap:
-    """Load image from local path or URL into QPixmap; optionally scale preserving aspect ratio."""
+def _content_digest(data: bytes) -> bytes:
+    """BLAKE2 hash of downloaded bytes, so different URLs serving the same image share a pixmap."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _json_default(obj):
+    """Serialize NumPy scalars (the data provider is pandas-backed) as plain Python values."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+def _json_loads(blob: bytes):
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _csv_stamp(csv_dir: Path) -> int:
+    """Newest modification time (ns) of the CSVs the data provider reads; 0 if none."""
     try:
-        if path_or_url.startswith(("http://", "https://")):
-            resp = requests.get(path_or_url, timeout=10)
-            resp.raise_for_status()
-            pm = QPixmap()
-            pm.loadFromData(resp.content)
-        else:
-            pm = QPixmap(path_or_url)
+        with os.scandir(csv_dir) as it:
+            return max((e.stat().st_mtime_ns for e in it if e.name.endswith(".csv")), default=0)
+    except OSError:
+        return 0
 
-        if not pm or pm.isNull():
-            return QPixmap()
 
-        if max_size is not None:
-            pm = pm.scaled(
-                max_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+class _PokemonCache:
+    """SQLite store of api.get_pokemon results, keyed by "identifier|form|language_id".
+
+    A meta row records the schema version and the CSVs' modification stamp the rows
+    were computed with; when either changes, the stored rows are dropped on connect.
+    The connection is opened lazily and shared with the prefetch workers, hence the lock.
+    """
+
+    def __init__(self, path: Path, ttl: int = POKEMON_CACHE_TTL, schema: int = POKEMON_CACHE_SCHEMA,
+                 csv_dir: Path = POKEMON_CACHE_CSV_DIR):
+        self.path = path
+        self.ttl = ttl
+        self.schema = schema
+        self.csv_dir = csv_dir
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(identifier: str, form: str | None, language_id: int) -> str:
+        return f"{str(identifier).strip().lower()}|{form or ''}|{language_id}"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS pokemon(key TEXT PRIMARY KEY, ts INTEGER, json BLOB)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT)")
+            stamp = f"{self.schema}:{_csv_stamp(self.csv_dir)}"
+            row = conn.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+            if row is None or row[0] != stamp:
+                # other result shape or other data: nothing stored is valid anymore
+                conn.execute("DELETE FROM pokemon")
+                conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('stamp', ?)", (stamp,))
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            row = self._connect().execute("SELECT ts, json FROM pokemon WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        return _json_loads(row[1])
+
+    def put(self, key: str, data: dict):
+        blob = _json_dumps(data)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO pokemon(key, ts, json) VALUES (?, ?, ?)",
+                (key, int(time.time()), blob),
             )
-        return pm
+            conn.commit()
+
+
+_POKEMON_CACHE = _PokemonCache(POKEMON_CACHE_PATH)
+
+
+def _fetch_pokemon(identifier: str, form: str | None, language_id: int) -> dict:
+    """api.get_pokemon with the on-disk cache in front of it (safe to call from worker threads)."""
+    key = _POKEMON_CACHE.key(identifier, form, language_id)
+    try:
+        data = _POKEMON_CACHE.get(key)
+    except (sqlite3.Error, OSError, ValueError):
+        data = None
+    if data is None:
+        data = api.get_pokemon(identifier, form=form, language_id=language_id)
+        try:
+            _POKEMON_CACHE.put(key, data)
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            pass  # caching is best-effort
+    return data
+
+
+# In-memory layer on top: re-visiting a Pokémon (language switch, View button, form
+# combo) is a dict lookup. The returned dicts are shared, so callers must not mutate them.
+@functools.lru_cache(maxsize=256)
+def _cached_get_pokemon(identifier: str, form: str | None, language_id: int) -> dict:
+    return _fetch_pokemon(identifier, form, language_id)
+
+
+# Flavor texts come with the games' hard line/page breaks
+_FLAVOR_TRANS = str.maketrans({"\n": " ", "\f": " "})
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_get_flavor(identifier: str, language_id: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """(versions, flavor texts) paired up and normalized for display."""
+    res = api.get_pokedex_flavor(identifier, language_id=language_id)
+    versions = res.get("versions") or []
+    texts = res.get("flavor_texts") or []
+    n = min(len(versions), len(texts))
+    return (
+        tuple(str(v) for v in versions[:n]),
+        tuple(str(t).translate(_FLAVOR_TRANS) for t in texts[:n]),
+    )
+
+
+def _is_metered_connection() -> bool:
+    """True when Qt reports a metered network (e.g. mobile data); False if unknown."""
+    try:
+        if QNetworkInformation.loadDefaultBackend():
+            info = QNetworkInformation.instance()
+            return info is not None and info.isMetered()
+    except Exception:
+        pass
+    return False
+
+
+def _is_url(path_or_url: str) -> bool:
+    return path_or_url.startswith(("http://", "https://"))
+
+
+def _media_url(url_or_path: str) -> QUrl:
+    return QUrl(url_or_path) if _is_url(url_or_path) else QUrl.fromLocalFile(os.path.abspath(url_or_path))
+
+
+def _dpr(label: QLabel | None) -> float:
+    return label.devicePixelRatioF() if label is not None else 1.0
+
+
+def _device_size(max_size: QSize, dpr: float) -> QSize:
+    return QSize(round(max_size.width() * dpr), round(max_size.height() * dpr))
+
+
+def _fit(src: QSize, max_size: QSize) -> QSize:
+    """src scaled to fit max_size, preserving aspect ratio."""
+    return src.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio)
+
+
+def _pixmap_key(path_or_url: str, max_size: QSize | None, dpr: float = 1.0) -> tuple:
+    return (
+        _URL_TO_DIGEST.get(path_or_url, path_or_url),
+        max_size.width() if max_size is not None else -1,
+        max_size.height() if max_size is not None else -1,
+        dpr,
+    )
+
+
+def _cached_pixmap(key: tuple) -> QPixmap | None:
+    pm = _PIXMAP_CACHE.get(key)
+    if pm is not None:
+        _PIXMAP_CACHE.move_to_end(key)
+    return pm
+
+
+def _store_pixmap(key: tuple, pm: QPixmap) -> QPixmap:
+    _PIXMAP_CACHE[key] = pm
+    if len(_PIXMAP_CACHE) > _PIXMAP_MAX:
+        _PIXMAP_CACHE.popitem(last=False)
+    return pm
+
+
+def _finish_pixmap(source: str, key: tuple, pm: QPixmap, max_size: QSize | None,
+                   label: QLabel | None = None) -> QPixmap:
+    """Scale a freshly decoded pixmap to the label's device pixels, preserving aspect ratio.
+
+    Small thumbnails are scaled once with FastTransformation. For larger sizes a cheap
+    FastTransformation copy is returned right away; the SmoothTransformation version is
+    computed once the event loop is idle, stored in the cache (so the next lookup gets
+    it directly) and swapped into label if it still shows the same image.
+    """
+    if not pm or pm.isNull():
+        return QPixmap()
+    if max_size is None:
+        return _store_pixmap(key, pm)
+
+    dpr = _dpr(label)
+    target = _device_size(max_size, dpr)
+
+    def scaled(mode: Qt.TransformationMode) -> QPixmap:
+        out = pm.scaled(target, Qt.AspectRatioMode.KeepAspectRatio, mode)
+        out.setDevicePixelRatio(dpr)
+        return out
+
+    if max(target.width(), target.height()) < SMOOTH_MIN_PX:
+        return _store_pixmap(key, scaled(Qt.TransformationMode.FastTransformation))
+
+    def refine():
+        smooth = _store_pixmap(key, scaled(Qt.TransformationMode.SmoothTransformation))
+        if label is not None and shiboken6.isValid(label) and label.property("imageSource") == source:
+            label.setPixmap(smooth)
+
+    QTimer.singleShot(0, refine)
+    return scaled(Qt.TransformationMode.FastTransformation)
+
+
+def _load_pixmap(path: str, max_size: QSize | None = QSize(256, 256),
+                 label: QLabel | None = None) -> QPixmap:
+    """Load image from a local path into QPixmap; optionally scale preserving aspect ratio.
+
+    Remote images go through PokedexWindow._set_label_image (asynchronous).
+    """
+    key = _pixmap_key(path, max_size, _dpr(label))
+    cached = _cached_pixmap(key)
+    if cached is not None:
+        return cached
+
+    try:
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        # Decoders that can (JPEG) decode straight at the final size. For the others (PNG)
+        # QImageReader would just smooth-scale after decoding, skipping _finish_pixmap's fast path
+        if (max_size is not None and size.isValid()
+                and reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize)):
+            reader.setScaledSize(_fit(size, _device_size(max_size, _dpr(label))))
+        image = reader.read()
+        pm = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        return _finish_pixmap(path, key, pm, max_size, label)
     except Exception:
         return QPixmap()
 
 
+def _pixmap_from_image(url: str, image: QImage, max_size: QSize | None,
+                       label: QLabel | None = None) -> QPixmap:
+    """Wrap an image decoded by a _DecodeJob (GUI thread only: QPixmap is not thread-safe)."""
+    key = _pixmap_key(url, max_size, _dpr(label))
+    cached = _cached_pixmap(key)
+    if cached is not None:
+        return cached
+    pm = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+    return _finish_pixmap(url, key, pm, max_size, label)
+
+
+class _PokemonSignals(QObject):
+    finished = Signal(object, object)  # (identifier, form, language_id), data dict or None
+
+
+class _PokemonJob(QRunnable):
+    """Call api.get_pokemon on a QThreadPool worker (used to prefetch alternate forms)."""
+
+    def __init__(self, identifier: str, form: str | None, language_id: int):
+        super().__init__()
+        self.key = (identifier, form, language_id)
+        self.signals = _PokemonSignals()
+
+    def run(self):
+        identifier, form, language_id = self.key
+        try:
+            data = _cached_get_pokemon(identifier, form, language_id)
+        except Exception:
+            data = None
+        self.signals.finished.emit(self.key, data)
+
+
+class _LoadSignals(QObject):
+    # token, identifier, form, data dict (None on error), error message
+    finished = Signal(int, str, object, object, str)
+
+
+class _LoadJob(QRunnable):
+    """Fetch the Pokémon the user asked for (data + flavor texts) off the GUI thread.
+
+    Both results end up in the in-memory caches, so the binders that run in the
+    receiving slot only do dictionary lookups.
+    """
+
+    def __init__(self, token: int, identifier: str, form: str | None, language_id: int):
+        super().__init__()
+        self.token = token
+        self.identifier = identifier
+        self.form = form
+        self.language_id = language_id
+        self.signals = _LoadSignals()
+
+    def run(self):
+        data, error = None, ""
+        try:
+            data = _cached_get_pokemon(self.identifier, self.form, self.language_id)
+            if hasattr(api, "get_pokedex_flavor"):
+                try:
+                    _cached_get_flavor(self.identifier, self.language_id)
+                except Exception:
+                    pass  # _bind_pokedex_flavor shows the placeholder
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(self.token, self.identifier, self.form, data, error)
+
+
+class _PrefetchSignals(QObject):
+    images = Signal(list)  # main sprites of the Pokémon prefetched (fetched or already cached)
+
+
+class _PrefetchJob(QRunnable):
+    """Warm the on-disk caches for several Pokémon with one api.get_pokemon_many call.
+
+    Used for the evolution line after each load and for the recent list at startup;
+    the main sprites of those Pokémon are reported back so the window can warm them
+    too (see PokedexWindow._warm_sprites).
+    """
+
+    def __init__(self, identifiers: list[str], language_id: int):
+        super().__init__()
+        self.identifiers = identifiers
+        self.language_id = language_id
+        self.signals = _PrefetchSignals()
+
+    def run(self):
+        try:
+            images, missing = [], []
+            for ident in self.identifiers:
+                data = _POKEMON_CACHE.get(_POKEMON_CACHE.key(ident, None, self.language_id))
+                if data is None:
+                    missing.append(ident)
+                elif data.get("image"):
+                    images.append(data["image"])
+            if missing:
+                for ident, data in api.get_pokemon_many(missing, language_id=self.language_id).items():
+                    _POKEMON_CACHE.put(_POKEMON_CACHE.key(ident, None, self.language_id), data)
+                    if data.get("image"):
+                        images.append(data["image"])
+            self.signals.images.emit(images)
+        except Exception:
+            pass  # prefetch is best-effort
+
+
+class _SpriteSignals(QObject):
+    ready = Signal(dict, float)  # {local path: QImage scaled to device pixels}, device pixel ratio
+
+
+class _SpriteWarmup(QRunnable):
+    """Decode and smooth-scale local sprites on a QThreadPool worker (QPixmaps are made by the slot)."""
+
+    def __init__(self, paths: list[str], max_size: QSize, dpr: float):
+        super().__init__()
+        self.paths = paths
+        self.target = _device_size(max_size, dpr)
+        self.dpr = dpr
+        self.signals = _SpriteSignals()
+
+    def run(self):
+        images = {}
+        for path in self.paths:
+            image = QImage(path)
+            if not image.isNull():
+                images[path] = image.scaled(
+                    self.target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+                )
+        self.signals.ready.emit(images, self.dpr)
+
+
+class _ImageSignals(QObject):
+    finished = Signal(str, QImage)  # url, decoded image (null on failure)
+
+
+class _IconSignals(QObject):
+    ready = Signal(dict)  # {type_id: QImage}
+
+
+class _IconWarmup(QRunnable):
+    """Decode every type icon in a folder on a QThreadPool worker (QPixmaps are made by the slot)."""
+
+    def __init__(self, icon_dir: Path):
+        super().__init__()
+        self.icon_dir = icon_dir
+        self.signals = _IconSignals()
+
+    def run(self):
+        images = {}
+        try:
+            with os.scandir(self.icon_dir) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext != ".png" or not stem.isdigit():
+                        continue
+                    image = QImage(entry.path)
+                    if not image.isNull():
+                        images[int(stem)] = image
+        except OSError:
+            pass  # _type_pixmap loads on demand
+        self.signals.ready.emit(images)
+
+
+class _DecodeJob(QRunnable):
+    """Decode downloaded image bytes on a QThreadPool worker.
+
+    Decoding into a QImage is safe off the GUI thread; only the cheap QPixmap
+    conversion is left for the receiving slot.
+    """
+
+    def __init__(self, url: str, data: bytes):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.signals = _ImageSignals()
+
+    def run(self):
+        image = QImage()
+        image.loadFromData(self.data)
+        self.signals.finished.emit(self.url, image)
+
+
+@functools.cache
+def _lang_name_map() -> dict[tuple[int, int], str]:
+    """{(language_id, local_language_id): name}, built once from language_names.csv."""
+    names: dict[tuple[int, int], str] = {}
+    for row in _read_csv("language_names"):
+        key = (int(row["language_id"]), int(row["local_language_id"]))
+        names.setdefault(key, row["name"])  # first row wins
+    return names
+
+
+@functools.cache
+def _official_lang_ids() -> list[int]:
+    """Ids of the official languages (languages.csv official == 1), in their display order."""
+    rows = [row for row in _read_csv("languages") if row["official"] == "1"]
+    rows.sort(key=lambda row: int(row["order"]))
+    return [int(row["id"]) for row in rows]
+
+
 def _lang_autonym(lang_id: int) -> str:
     """
     Prefer the autonym (language name in its own language): local_language_id == language_id.
     Fallback to English exonym (local_language_id == 9). Final fallback: the numeric id.
     """
-    df = language_names_df
-    row = df[(df["language_id"] == lang_id) & (df["local_language_id"] == lang_id)]
-    if not row.empty:
-        return str(row["name"].iloc[0])
-    row = df[(df["language_id"] == lang_id) & (df["local_language_id"] == 9)]
-    if not row.empty:
-        return str(row["name"].iloc[0])
-    return str(lang_id)
+    names = _lang_name_map()
+    return names.get((lang_id, lang_id)) or names.get((lang_id, 9)) or str(lang_id)
+
+
+@functools.cache
+def _names_by_lang() -> dict[int, list[str]]:
+    """{local_language_id: species names}, grouped once from pokemon_species_names.csv."""
+    names: dict[int, list[str]] = {}
+    for row in _read_csv("pokemon_species_names"):
+        names.setdefault(int(row["local_language_id"]), []).append(row["name"])
+    return names
+
+
+@functools.cache
+def _capitalized_identifiers() -> list[str]:
+    return [row["identifier"].capitalize() for row in _read_csv("pokemon_species")]
+
+
+def _get_all_pokemon_names(lang_id: int) -> list[str]:
+    """Fetch all Pokémon names for autocomplete."""
+    return _names_by_lang().get(lang_id) or _capitalized_identifiers()
+
+
+@functools.cache
+def _autocomplete_names(lang_id: int) -> tuple[str, ...]:
+    """Names sorted case-insensitively, computed once per language."""
+    return tuple(sorted(set(_get_all_pokemon_names(lang_id)), key=str.casefold))
+
+
+# ---- Evolution card -----------------------------------------------------------
+
+class _EvoCard(QWidget):
+    """Sprite, name, dex number and a View button; recycled across binds."""
+
+    view_requested = Signal(str)  # identifier to load
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.identifier = ""
+
+        self.img = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
+        self.name_lbl = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
+        self.name_lbl.setWordWrap(True)
+        self.dex_lbl = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
+        self.btn = QPushButton("View")
+        # connected once; the card's current identifier is read at click time
+        self.btn.clicked.connect(lambda: self.view_requested.emit(self.identifier))
+
+        box = QVBoxLayout(self)
+        box.addWidget(self.img)
+        box.addWidget(self.name_lbl)
+        box.addWidget(self.dex_lbl)
+        box.addWidget(self.btn)
+        self.setMinimumWidth(120)
+
+    def bind(self, name: str, dex_number: int | None):
+        """Show another Pokémon's texts (the sprite is set by the window, see _set_label_image)."""
+        self.name_lbl.setText(name)
+        self.dex_lbl.setText(f"Dex #: {dex_number}" if dex_number is not None else "Dex #: —")
+        # load by dex number (fallback to name if missing)
+        self.identifier = str(dex_number) if dex_number is not None else name
+        self.setVisible(True)
 
 
 # ---- Main Window --------------------------------------------------------------
@@ -103,10 +643,36 @@ class PokedexWindow(QWidget):
         self.setMinimumSize(900, 650)
         self.setWindowIcon(QIcon("data/sprites/sprites/items/poke-ball.png"))
 
-        # Playback
+        # Background work (image decoding, prefetch)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(8)
+
+        # Remote images: async downloads on the event loop, backed by an HTTP disk cache.
+        # url -> [(label, size, placeholder)] waiting for it (download or decode in progress)
+        self._nam = QNetworkAccessManager(self)
+        http_cache = QNetworkDiskCache(self)
+        http_cache.setCacheDirectory(str(HTTP_CACHE_DIR))
+        http_cache.setMaximumCacheSize(HTTP_CACHE_MAX_BYTES)
+        self._nam.setCache(http_cache)
+        self._pending_images: dict[str, list[tuple[QLabel, QSize | None, str]]] = {}
+
+        # Prefetched forms, keyed (identifier, form, language_id); data lives in _cached_get_pokemon.
+        # Only the forms of _form_data_scope = (identifier, language_id) are tracked as ready:
+        # older keys may have been evicted from that LRU since
+        self._form_data_ready: set[tuple] = set()
+        self._form_data_scope: tuple | None = None
+        self._form_data_inflight: set[tuple] = set()
+        self._awaiting_form_key: tuple | None = None  # form picked while its prefetch was running
+        self._load_token = 0  # bumped per _load_pokemon_data; older _LoadJob results are dropped
+        self._recent_head: str | None = None  # last entry _remember_recent wrote
+
+        # Playback; player_next holds the upcoming cry already loaded (swapped in on click)
         self.player = QMediaPlayer(self)
         self.audio = QAudioOutput(self)
         self.player.setAudioOutput(self.audio)
+        self.player_next = QMediaPlayer(self)
+        self.audio_next = QAudioOutput(self)
+        self.player_next.setAudioOutput(self.audio_next)
 
         # ---------- Top bar: search + form combo + cry ----------
         self.input_name = QLineEdit()
@@ -125,18 +691,14 @@ class PokedexWindow(QWidget):
         self._forms_cache_identifier = None
         self._forms_cache_list: List[str] = None  # type: ignore
         self._forms_order: List[str] = []
+        self._forms_cache_sig: int | None = None  # hash of (identifier, raw forms) last bound
 
         # ---------- Language bar (11 official languages) ----------
         # Default language is English (id=9)
         self.current_language_id = 9
 
         # Build official languages dynamically from languages.csv (official==1), ordered.
-        official_ids: List[int] = (
-            languages_df[languages_df["official"] == 1]
-            .sort_values("order")["id"]
-            .astype(int)
-            .tolist()
-        )
+        official_ids: List[int] = _official_lang_ids()
         # Create (id, display_name) pairs using autonyms
         self._official_langs: List[Tuple[int, str]] = [(lid, _lang_autonym(lid)) for lid in official_ids]
 
@@ -154,6 +716,18 @@ class PokedexWindow(QWidget):
 
         self.types_row = QHBoxLayout()
         self.types_row.addStretch()
+        # a Pokémon has at most two types: two permanent slots, shown/hidden per bind
+        self._type_slots: list[QLabel] = [QLabel(), QLabel()]
+        for slot in self._type_slots:
+            slot.setVisible(False)
+            self.types_row.addWidget(slot)
+        self.types_row.addStretch()
+        # All type icons (~18 small PNGs) are decoded once in the background at startup;
+        # QPixmap sharing makes chips cheap. A bind before that finishes loads on demand.
+        self._type_pixmaps: dict[int, QPixmap] = {}
+        warmup = _IconWarmup(TYPE_ICON_DIR)
+        warmup.signals.ready.connect(self._on_icons_ready)
+        self._pool.start(warmup)
 
         # Pokédex flavor (versions + text)
         self.dex_group = QGroupBox("Pokédex Entry")
@@ -188,6 +762,15 @@ class PokedexWindow(QWidget):
             self.stats_labels[s] = v
             self.stats_grid.addWidget(k, r, 0, alignment=Qt.AlignmentFlag.AlignRight)
             self.stats_grid.addWidget(v, r, 1, alignment=Qt.AlignmentFlag.AlignLeft)
+        # Accepted spellings per displayed stat, first hit wins (built once, not per bind)
+        self._stat_keys: list[tuple[str, tuple[str, ...]]] = [
+            ("HP", ("HP", "hp")),
+            ("Atk", ("Atk", "atk", "attack")),
+            ("Def", ("Def", "def", "defense")),
+            ("SpA", ("SpA", "spa", "special-attack")),
+            ("SpD", ("SpD", "spd", "special-defense")),
+            ("Spe", ("Spe", "spe", "speed")),
+        ]
 
         stats_group = QGroupBox("Base Stats")
         sg_layout = QVBoxLayout()
@@ -199,6 +782,7 @@ class PokedexWindow(QWidget):
         self.evo_row.setContentsMargins(0, 0, 0, 0)
         self.evo_row.setSpacing(16)
         self.evo_row.addStretch()
+        self._evo_card_pool: list[_EvoCard] = []
 
         evo_scroll = QScrollArea()
         evo_scroll.setWidgetResizable(True)
@@ -250,7 +834,21 @@ class PokedexWindow(QWidget):
         # ---------- Signals ----------
         self.btn_load.clicked.connect(self._on_load_clicked)
         self.btn_play_cry.clicked.connect(self._on_play_cry_clicked)
-        self.form_combo.currentTextChanged.connect(self._on_form_changed)
+        self.form_combo.currentTextChanged.connect(self._on_form_text_changed)
+
+        # Scrolling through the forms combo only loads the final selection
+        self._pending_form = ""
+        self._form_debounce_timer = QTimer(self)
+        self._form_debounce_timer.setSingleShot(True)
+        self._form_debounce_timer.setInterval(150)
+        self._form_debounce_timer.timeout.connect(self._apply_pending_form)
+
+        # Clicking through several language buttons only reloads the last one
+        self._pending_language: int | None = None
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self._do_reload)
 
         # State
         self.current_identifier = None
@@ -264,6 +862,9 @@ class PokedexWindow(QWidget):
         # Self autocomplete of the searching bar
         self._init_autocomplete()
 
+        # Fill the caches for likely first picks once the window is up
+        QTimer.singleShot(0, self._warm_cache)
+
 
     # ---- Language bar ---------------------------------------------------------
 
@@ -286,10 +887,17 @@ class PokedexWindow(QWidget):
         layout.addStretch()
 
     def _on_language_selected(self, lang_id: int):
+        """Remember the language; the reload runs once the clicks settle (see _do_reload)."""
+        self._pending_language = lang_id
+        self._reload_timer.start()  # restarts the 50 ms window
+
+    def _do_reload(self):
         """Set language and reload current Pokémon."""
-        if self.current_language_id == lang_id:
+        lang_id, self._pending_language = self._pending_language, None
+        if lang_id is None or self.current_language_id == lang_id:
             return
         self.current_language_id = lang_id
+        self._refresh_autocomplete()
 
         if self.current_identifier:
             current_form = self.form_combo.currentText().strip() or None if self.form_combo.count() > 0 else None
@@ -305,37 +913,184 @@ class PokedexWindow(QWidget):
         self.current_identifier = ident
         self._load_pokemon_data(identifier=ident, form=None)
 
+    # ---- Startup warm-up --------------------------------------------------------
+
+    @staticmethod
+    def _settings() -> QSettings:
+        return QSettings("pokedex", "pokedex")
+
+    @classmethod
+    def _recent(cls) -> list[str]:
+        # dex numbers only, without duplicates (older versions also stored names)
+        recent = cls._settings().value("recent", RECENT_DEFAULT, type=list)
+        return list(dict.fromkeys(str(r) for r in recent if str(r).isdigit()))
+
+    def _remember_recent(self, dex_number: str):
+        # only called after a successful load, so typos never reach the warm-up list
+        if dex_number == self._recent_head:
+            return  # form / language reloads of the Pokémon already on top
+        self._recent_head = dex_number
+        recent = [dex_number] + [r for r in self._recent() if r != dex_number]
+        self._settings().setValue("recent", recent[:RECENT_MAX])
+
+    def _warm_cache(self):
+        """Prefetch data + sprites of recently viewed Pokémon (skipped on metered networks)."""
+        if not hasattr(api, "get_pokemon_many") or _is_metered_connection():
+            return
+        self._start_prefetch(self._recent()[:RECENT_MAX])
+
+    def _on_form_text_changed(self, form_text: str):
+        self._pending_form = form_text
+        self._form_debounce_timer.start()  # restarts the 150 ms window
+
+    def _apply_pending_form(self):
+        self._on_form_changed(self._pending_form)
+
     def _on_form_changed(self, form_text: str):
         if not self.current_identifier:
             return
-        self._load_pokemon_data(identifier=self.current_identifier, form=(form_text or None))
+        form = form_text or None
+        key = (self.current_identifier, form, self.current_language_id)
+        if key in self._form_data_inflight:
+            # Prefetch already running: _on_form_data_ready binds it instead of fetching twice
+            self._awaiting_form_key = key
+            return
+        self._load_pokemon_data(identifier=self.current_identifier, form=form)
 
     def _load_pokemon_data(self, identifier: str, form: str | None):
-        """Call API and bind to UI; always pass current language_id."""
-        try:
-            if hasattr(api, "get_pokemon"):
-                data = api.get_pokemon(identifier, form=form, language_id=self.current_language_id)
-            else:
+        """Fetch on a worker thread (always with the current language_id); bound in _on_pokemon_loaded."""
+        self._form_debounce_timer.stop()  # a pending form pick must not override this load
+        self._awaiting_form_key = None
+        if not hasattr(api, "get_pokemon"):
+            try:
                 data = api(identifier)  # type: ignore
+            except Exception as e:
+                QMessageBox.critical(self, "Error loading Pokémon", str(e))
+                return
+            self._bind_pokemon(identifier, form, data)
+            return
+
+        self._load_token += 1
+        self.btn_load.setEnabled(False)
+        job = _LoadJob(self._load_token, identifier, form, self.current_language_id)
+        job.signals.finished.connect(self._on_pokemon_loaded)
+        self._pool.start(job)
+
+    def _on_pokemon_loaded(self, token: int, identifier: str, form: str | None, data: dict | None, error: str):
+        if token != self._load_token:
+            return  # superseded by a newer load
+        self.btn_load.setEnabled(True)
+        if data is None:
+            QMessageBox.critical(self, "Error loading Pokémon", error)
+            return
+        # by dex number: "25", "Pikachu" and "pikachu" are one entry, whatever the language
+        dex_number = data.get("dex_number")
+        if dex_number is not None:
+            self._remember_recent(str(dex_number))
+        self._bind_pokemon(identifier, form, data)
 
+    def _bind_pokemon(self, identifier: str, form: str | None, data: dict):
+        try:
             if not isinstance(data, dict):
                 raise ValueError("typed_function.get_pokemon must return a dict")
 
-            self.current_data = data
+            # Types, stats and the evolution dex numbers don't depend on the language:
+            # on a pure language switch only the texts need rebinding
+            prev, self.current_data = self.current_data, data
             self._bind_header(data)
-            self._bind_types(data.get("types", []))
-            self._bind_stats(data.get("base_stats", {}))
-            self._bind_evolution_line(data.get("evolution_line", []))
+            if data.get("types", []) != prev.get("types", []):
+                self._bind_types(data.get("types", []))
+            if data.get("base_stats", {}) != prev.get("base_stats", {}):
+                self._bind_stats(data.get("base_stats", {}))
+            evo_list = data.get("evolution_line", [])
+            if [n.get("dex_number") for n in evo_list] == [n.get("dex_number") for n in prev.get("evolution_line", [])]:
+                self._rename_evolution_line(evo_list)
+            else:
+                self._bind_evolution_line(evo_list)
             self._bind_forms(identifier, data)
             self._bind_pokedex_flavor(identifier)  # uses current language id
 
             cries = data.get("cries") or []
             self.btn_play_cry.setEnabled(bool(cries))
             self.current_cry_index = 0
+            self._preload_next_cry()
+
+            self._prefetch_forms(identifier, form, data.get("forms") or [])
+            self._prefetch_evolution_line(data)
 
         except Exception as e:
             QMessageBox.critical(self, "Error loading Pokémon", str(e))
-            
+
+    def _prefetch_forms(self, identifier: str, current_form: str | None, forms: list):
+        """Fetch the other forms (and their sprites) in the background so switching is instant."""
+        if not hasattr(api, "get_pokemon"):
+            return
+        scope = (identifier, self.current_language_id)
+        if scope != self._form_data_scope:
+            self._form_data_ready.clear()
+            self._form_data_scope = scope
+        for f in forms:
+            key = (identifier, f, self.current_language_id)
+            if f == current_form or key in self._form_data_ready or key in self._form_data_inflight:
+                continue
+            self._form_data_inflight.add(key)
+            job = _PokemonJob(*key)
+            job.signals.finished.connect(self._on_form_data_ready)
+            self._pool.start(job)
+
+    def _prefetch_evolution_line(self, data: dict):
+        """Fetch the other evolution-line members (what the View buttons load) in one batch."""
+        if not hasattr(api, "get_pokemon_many"):
+            return
+        current = data.get("dex_number")
+        ids = [
+            str(node["dex_number"]) for node in data.get("evolution_line", [])
+            if node.get("dex_number") is not None and node["dex_number"] != current
+        ]
+        if ids:
+            self._start_prefetch(ids)
+
+    def _start_prefetch(self, identifiers: list[str]):
+        job = _PrefetchJob(identifiers, self.current_language_id)
+        job.signals.images.connect(self._warm_sprites)
+        self._pool.start(job)
+
+    def _warm_sprites(self, images: list):
+        """Get main sprites ready before they are shown.
+
+        Remote ones are downloaded; local ones are decoded and scaled off-thread into
+        _PIXMAP_CACHE, at the key _set_label_image(lbl_sprite, ...) looks up.
+        """
+        dpr = _dpr(self.lbl_sprite)
+        local = []
+        for image in dict.fromkeys(images):
+            if _is_url(image):
+                self._prefetch_image(image)
+            elif _cached_pixmap(_pixmap_key(image, SPRITE_SIZE, dpr)) is None:
+                local.append(image)
+        if local:
+            job = _SpriteWarmup(local, SPRITE_SIZE, dpr)
+            job.signals.ready.connect(self._on_sprites_decoded)
+            self._pool.start(job)
+
+    def _on_sprites_decoded(self, images: dict, dpr: float):
+        for path, image in images.items():
+            pm = QPixmap.fromImage(image)
+            pm.setDevicePixelRatio(dpr)
+            _store_pixmap(_pixmap_key(path, SPRITE_SIZE, dpr), pm)
+
+    def _on_form_data_ready(self, key: tuple, data: dict | None):
+        self._form_data_inflight.discard(key)
+        if isinstance(data, dict):
+            if (key[0], key[2]) == self._form_data_scope:
+                self._form_data_ready.add(key)
+            image = data.get("image")
+            if image:
+                self._warm_sprites([image])
+        if key == self._awaiting_form_key:
+            identifier, form, _ = key
+            self._load_pokemon_data(identifier=identifier, form=form)
+
     # ---- Binders --------------------------------------------------------------
 
     def _bind_header(self, data: dict):
@@ -344,114 +1099,182 @@ class PokedexWindow(QWidget):
         self.lbl_name.setText(f"<b>{name}</b>")
         self.lbl_dex.setText(f"Dex #: {dex}")
 
-        image = data.get("image")
-        pm = _load_pixmap(image) if image else QPixmap()
-        if pm.isNull():
-            self.lbl_sprite.setText("No image")
-        else:
-            self.lbl_sprite.setPixmap(pm)
-            self.lbl_sprite.setText("")
+        self._set_label_image(self.lbl_sprite, data.get("image"), SPRITE_SIZE, placeholder="No image")
 
     def _bind_types(self, types: list):
         """Mostrar los tipos como iconos, usando los ids que vienen en 'types'."""
-        # limpiar layout    
-        while self.types_row.count() > 0:
-            item = self.types_row.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
+        for lbl, t in zip(self._type_slots, types):
+            lbl.setVisible(True)
 
-        self.types_row.addStretch()
-
-        for t in types:
             # t debería ser un número de tipo (por ejemplo 10)
             try:
                 type_id = int(t)
             except (TypeError, ValueError):
-            # si viene algo raro, lo mostramos como texto
-                lbl = QLabel(str(t))
-                self.types_row.addWidget(lbl)
+                # si viene algo raro, lo mostramos como texto
+                lbl.setText(str(t))
                 continue
 
-            icon_path = TYPE_ICON_DIR / f"{type_id}.png"
-
-            lbl = QLabel()
-            pm = QPixmap(str(icon_path))
+            pm = self._type_pixmap(type_id)
             if pm.isNull():
                 # si no se pudo cargar la imagen, mostramos el id como texto
                 lbl.setText(str(type_id))
             else:
                 lbl.setPixmap(pm)
 
-            self.types_row.addWidget(lbl)
+        for lbl in self._type_slots[len(types):]:
+            lbl.setVisible(False)
 
-        self.types_row.addStretch()
+    def _type_pixmap(self, type_id: int) -> QPixmap:
+        pm = self._type_pixmaps.get(type_id)
+        if pm is None:  # warm-up not finished yet
+            pm = self._type_pixmaps[type_id] = QPixmap(str(TYPE_ICON_DIR / f"{type_id}.png"))
+        return pm
 
+    def _on_icons_ready(self, images: dict):
+        for type_id, image in images.items():
+            self._type_pixmaps.setdefault(type_id, QPixmap.fromImage(image))
 
     def _bind_stats(self, stats: dict):
-        for key, lbl in self.stats_labels.items():
-            val = stats.get(key) or stats.get(key.lower()) or "—"
-            lbl.setText(str(val))
+        for disp, cands in self._stat_keys:
+            # membership test instead of `or`, so a real 0 is shown as 0
+            val = next((stats[c] for c in cands if c in stats), "—")
+            self.stats_labels[disp].setText(str(val))
 
     def _bind_evolution_line(self, evo_list: List[dict]):
-        """Render evolution cards horizontally inside a scroll area."""
-        while self.evo_row.count() > 0:
-            item = self.evo_row.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
-        for node in evo_list:
-            # NEW: also pass dex_number to the card
-            w = self._make_evo_card(
+        """Render evolution cards horizontally inside a scroll area (cards are recycled)."""
+        for idx, node in enumerate(evo_list):
+            self._update_evo_card(
+                idx,
                 name=node.get("name", "?"),
                 image=node.get("image"),
                 dex_number=node.get("dex_number")
             )
-            self.evo_row.addWidget(w)
-        self.evo_row.addStretch()
+        for card in self._evo_card_pool[len(evo_list):]:
+            card.setVisible(False)
+
+    def _rename_evolution_line(self, evo_list: list[dict]):
+        """Same evolution line as shown: refresh the (localized) names only."""
+        for card, node in zip(self._evo_card_pool, evo_list):
+            card.bind(node.get("name", "?"), node.get("dex_number"))
+
+    def _update_evo_card(self, idx: int, name: str, image: str | None, dex_number: int | None):
+        """Fill the idx-th pooled card, creating it (before the trailing stretch) if needed."""
+        if idx >= len(self._evo_card_pool):
+            card = _EvoCard()
+            card.view_requested.connect(
+                lambda ident: self._load_pokemon_data(identifier=ident, form=None)
+            )
+            self.evo_row.insertWidget(idx, card)
+            self._evo_card_pool.append(card)
+        card = self._evo_card_pool[idx]
 
+        self._set_label_image(card.img, image, QSize(96, 96))
+        card.bind(name, dex_number)
 
-    def _make_evo_card(self, name: str, image: str | None, dex_number: int | None) -> QWidget:
-        """Create a small card with sprite, name, dex number and a button to open that Pokémon by dex number."""
-        box = QVBoxLayout()
-        img = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
-        pm = _load_pixmap(image, QSize(96, 96)) if image else QPixmap()
-        img.setPixmap(pm) if not pm.isNull() else img.setText("—")
 
-        nm = QLabel(name, alignment=Qt.AlignmentFlag.AlignCenter)
-        nm.setWordWrap(True)
+    # -------- Images: local/cached synchronously, remote via QNetworkAccessManager --------
+    def _set_label_image(self, label: QLabel, path_or_url: str | None, max_size: QSize | None,
+                         placeholder: str = "—"):
+        """Show an image on label; remote images not cached yet are filled in when downloaded."""
+        label.setProperty("imageSource", path_or_url or "")
+        if not path_or_url:
+            label.setText(placeholder)
+            return
 
-        # NEW: show Dex number
-        dx = QLabel(f"Dex #: {dex_number}" if dex_number is not None else "Dex #: —",
-                    alignment=Qt.AlignmentFlag.AlignCenter)
+        if not _is_url(path_or_url):
+            self._show_pixmap(label, _load_pixmap(path_or_url, max_size, label), placeholder)
+            return
+        cached = _cached_pixmap(_pixmap_key(path_or_url, max_size, _dpr(label)))
+        if cached is not None:
+            self._show_pixmap(label, cached, placeholder)
+            return
 
-        btn = QPushButton("View")
-        # NEW: load by dex number (fallback to name if missing)
-        if dex_number is not None:
-            btn.clicked.connect(lambda: self._load_pokemon_data(identifier=str(dex_number), form=None))
-        else:
-            btn.clicked.connect(lambda: self._load_pokemon_data(identifier=name, form=None))
+        label.setText("…")
+        self._prefetch_image(path_or_url)
+        self._pending_images[path_or_url].append((label, max_size, placeholder))
+
+    def _prefetch_image(self, path_or_url: str):
+        """Start downloading a remote image unless it is already in flight (local files are no-ops)."""
+        if not _is_url(path_or_url) or path_or_url in self._pending_images:
+            return
+        self._pending_images[path_or_url] = []
+        self._request_image(path_or_url, attempt=0)
+
+    def _request_image(self, url: str, attempt: int):
+        request = QNetworkRequest(QUrl(url))
+        # Sprites never change: use the disk copy when there is one, even if stale
+        request.setAttribute(
+            QNetworkRequest.Attribute.CacheLoadControlAttribute,
+            QNetworkRequest.CacheLoadControl.PreferCache,
+        )
+        reply = self._nam.get(request)
+        reply.finished.connect(functools.partial(self._on_image_reply, url, reply, attempt))
+
+    def _on_image_reply(self, url: str, reply: QNetworkReply, attempt: int = 0):
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if status in HTTP_RETRY_STATUS and attempt < HTTP_RETRY_MAX:
+            reply.deleteLater()
+            delay = HTTP_RETRY_BACKOFF_MS * 2 ** attempt
+            QTimer.singleShot(delay, functools.partial(self._request_image, url, attempt + 1))
+            return
+        ok = reply.error() == QNetworkReply.NetworkError.NoError
+        data = bytes(reply.readAll()) if ok else b""
+        reply.deleteLater()
+        if data:
+            _URL_TO_DIGEST[url] = _content_digest(data)
+
+        to_decode = []
+        for label, max_size, placeholder in self._pending_images.get(url, []):
+            # The label may have been deleted or rebound to another image meanwhile
+            if not shiboken6.isValid(label) or label.property("imageSource") != url:
+                continue
+            cached = _cached_pixmap(_pixmap_key(url, max_size, _dpr(label))) if data else None
+            if cached is not None:  # same content already decoded (possibly under another URL)
+                self._show_pixmap(label, cached, placeholder)
+            elif not data:
+                label.setText(placeholder)
+            else:
+                to_decode.append((label, max_size, placeholder))
 
-        cont = QWidget()
-        box.addWidget(img)
-        box.addWidget(nm)
-        box.addWidget(dx)  # NEW: add dex label to the card
-        box.addWidget(btn)
-        cont.setLayout(box)
-        cont.setMinimumWidth(120)
-        return cont
+        if not to_decode:
+            self._pending_images.pop(url, None)
+            return
+        # Keep the url pending while decoding so later requests join these waiters
+        self._pending_images[url] = to_decode
+        job = _DecodeJob(url, data)
+        job.signals.finished.connect(self._on_image_decoded)
+        self._pool.start(job)
+
+    def _on_image_decoded(self, url: str, image: QImage):
+        for label, max_size, placeholder in self._pending_images.pop(url, []):
+            if not shiboken6.isValid(label) or label.property("imageSource") != url:
+                continue
+            self._show_pixmap(label, _pixmap_from_image(url, image, max_size, label), placeholder)
 
+    @staticmethod
+    def _show_pixmap(label: QLabel, pm: QPixmap, placeholder: str):
+        if pm.isNull():
+            label.setText(placeholder)
+        else:
+            label.setPixmap(pm)
 
     # -------- Forms combo: keep stable order (frozen) --------
     def _bind_forms(self, identifier: str, data: dict):
         """Populate the forms combo box while keeping the ORIGINAL order stable."""
 
+        # Fast path: same identifier and same raw forms as last bind -> nothing to normalize
+        raw_forms = data.get("forms")
+        sig = hash((identifier, tuple(raw_forms) if raw_forms is not None else None))
+        if sig == self._forms_cache_sig and self.form_combo.count() > 0:
+            self._sync_form_selection()
+            return
+
         # If the species changed, reset the frozen order
         if self._forms_cache_identifier != identifier:
             self._forms_order = []
 
         # Get the full list of forms
-        forms = data.get("forms")
+        forms = raw_forms
         if forms is None and hasattr(api, "get_available_forms"):
             try:
                 forms = api.get_available_forms(identifier)
@@ -459,8 +1282,7 @@ class PokedexWindow(QWidget):
                 forms = None
 
         # Normalize and deduplicate but preserve provider order
-        forms = [str(f).strip() for f in (forms or []) if str(f).strip()]
-        dedup_forms = list(dict.fromkeys(forms))
+        dedup_forms = list(dict.fromkeys(s for s in (str(f).strip() for f in (forms or [])) if s))
 
         # Freeze the order once
         if not self._forms_order:
@@ -472,17 +1294,14 @@ class PokedexWindow(QWidget):
             and self._forms_cache_list == self._forms_order
             and self.form_combo.count() > 0
         ):
-            self.form_combo.setEnabled(True)
-            desired_text = self.form_combo.currentText().strip()
-            if desired_text and self.form_combo.currentText() != desired_text:
-                self.form_combo.blockSignals(True)
-                self.form_combo.setCurrentText(desired_text)
-                self.form_combo.blockSignals(False)
+            self._forms_cache_sig = sig
+            self._sync_form_selection()
             return
 
         # Update cache
         self._forms_cache_identifier = identifier
         self._forms_cache_list = self._forms_order[:]
+        self._forms_cache_sig = sig
 
         # Rebuild using frozen order
         previous_choice = self.form_combo.currentText().strip() if self.form_combo.count() > 0 else ""
@@ -500,6 +1319,15 @@ class PokedexWindow(QWidget):
 
         self.form_combo.blockSignals(False)
 
+    def _sync_form_selection(self):
+        """Forms unchanged: keep the combo enabled and its current selection."""
+        self.form_combo.setEnabled(True)
+        desired_text = self.form_combo.currentText().strip()
+        if desired_text and self.form_combo.currentText() != desired_text:
+            self.form_combo.blockSignals(True)
+            self.form_combo.setCurrentText(desired_text)
+            self.form_combo.blockSignals(False)
+
     # -------- Pokédex flavor (version combo + text) --------
     def _bind_pokedex_flavor(self, identifier: str, language_id: int | None = None):
         """Fetch versions + flavor texts and bind to the UI block."""
@@ -514,15 +1342,9 @@ class PokedexWindow(QWidget):
 
         try:
             lang = self.current_language_id if language_id is None else language_id
-            res = api.get_pokedex_flavor(identifier, language_id=lang)
-            versions = res.get("versions") or []
-            texts = res.get("flavor_texts") or []
-
-            n = min(len(versions), len(texts))
-            versions = [str(v) for v in versions[:n]]
-            texts = [str(t).replace("\n", " ").replace("\f", " ") for t in texts[:n]]
+            versions, texts = _cached_get_flavor(identifier, lang)
 
-            if n == 0:
+            if not versions:
                 self.dex_group.setEnabled(False)
                 self.dex_combo.clear()
                 self.lbl_flavor.setText("—")
@@ -565,48 +1387,47 @@ class PokedexWindow(QWidget):
 
     def _play_audio(self, url_or_path: str):
         try:
-            if url_or_path.startswith(("http://", "https://")):
-                self.player.setSource(QUrl(url_or_path))
-            else:
-                self.player.setSource(QUrl.fromLocalFile(os.path.abspath(url_or_path)))
+            source = _media_url(url_or_path)
+            if self.player_next.source() == source:
+                # Already buffered by _preload_next_cry: swap players instead of reloading
+                self.player.stop()
+                self.player, self.player_next = self.player_next, self.player
+                self.audio, self.audio_next = self.audio_next, self.audio
+            elif self.player.source() != source:
+                self.player.setSource(source)
+            self.player.setPosition(0)
             self.audio.setVolume(0.8)  # 0–1
             self.player.play()
+            self._preload_next_cry()
         except Exception as e:
             QMessageBox.warning(self, "Audio", f"Could not play cry:\n{e}")
 
+    def _preload_next_cry(self):
+        """Load the cry the next click will play into the idle player (loading does not play it)."""
+        cries = self.current_data.get("cries") or []
+        if not cries:
+            return
+        source = _media_url(cries[self.current_cry_index % len(cries)])
+        if source not in (self.player.source(), self.player_next.source()):
+            self.player_next.setSource(source)
+
     def _init_autocomplete(self):
-        all_names = self._get_all_pokemon_names()
-        self._all_pokemon_names = sorted(set(all_names), key=str.casefold)
-        self._completer_model= QStringListModel(self._all_pokemon_names,self)
+        # Qt does the (case-insensitive, prefix) filtering; the model always holds every name
+        self._completer_model= QStringListModel(list(_autocomplete_names(self.current_language_id)),self)
         self._completer= QCompleter(self._completer_model,self)
         self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        self._completer.setMaxVisibleItems(10)
         self._completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
 
         self.input_name.setCompleter(self._completer)
 
-        self.input_name.textEdited.connect(self._on_search_text_edited)
         self.input_name.returnPressed.connect(self._on_load_clicked)
 
-    def _get_all_pokemon_names(self) -> list[str]:
-        """Fetch all Pokémon names for autocomplete."""
-        lang= self.current_language_id
-        df=pokemon_species_names_df[pokemon_species_names_df['local_language_id']==lang]
-        if df.empty:
-            return pokemon_species_df['identifier'].str.capitalize().tolist()
-        return df['name'].tolist()
+    def _refresh_autocomplete(self):
+        """Point the completer at the names of the current language."""
+        self._completer_model.setStringList(list(_autocomplete_names(self.current_language_id)))
 
-    def _on_search_text_edited(self, text: str):
-        """Update completer model based on current text."""
-
-        #pattern = text.str().casefold()
-        pattern = text.strip().casefold()
-
-        if not pattern:
-            self._completer_model.setStringList([])
-            return
-        matches = [name for name in self._all_pokemon_names if name.casefold().startswith(pattern)]
-        self._completer_model.setStringList(matches[:10])
-    
 
 
 # ---- Entrypoint ---------------------------------------------------------------
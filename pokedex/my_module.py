@@ -2,216 +2,142 @@
 sphinx and the right syntaxe for docstrings.
 """
 
-import numpy as np
-import pandas as pd
+import functools
+import math
 
-pokemon_df = pd.read_csv("data/csv/pokemon.csv")
-pokemon_evolution_df = pd.read_csv("data/csv/pokemon_evolution.csv")
-pokemon_species_df = pd.read_csv("data/csv/pokemon_species.csv")
+from pokedex import _data
 
 
-pokemon_types_df = pd.read_csv("data/csv/pokemon_types.csv")
-types_df = pd.read_csv("data/csv/types.csv")
-#types_sprites_df= pd.read_csv("data/sprites/sprites/types/generation-ix/scarlet-violet.csv")
+def _to_id(identifier, name_to_id):
+    # int for an int, a name known to name_to_id or a numeric str; -1 otherwise
+    if isinstance(identifier, int):
+        return identifier
+    if isinstance(identifier, str):
+        known = name_to_id.get(identifier.lower())
+        if known is not None:
+            return known
+    try:
+        return int(identifier)
+    except (TypeError, ValueError):
+        return -1
 
-pokemon_stats_df = pd.read_csv("data/csv/pokemon_stats.csv")
-stats_df = pd.read_csv("data/csv/stats.csv")
 
-pokemon_forms_df = pd.read_csv("data/csv/pokemon_forms.csv")
+def _resolve_species_id(identifier):
+    # species id for a dex number (25, "25") or a species name ("pikachu")
+    species_id = _to_id(identifier, _data.SPECIES_NAME_TO_ID)
+    if species_id not in _data.SPECIES_BY_ID.index:
+        raise ValueError(f"Pokémon '{identifier}' not found")
+    return species_id
 
 
-pokemon_species_flavor_text_df = pd.read_csv("data/csv/pokemon_species_flavor_text.csv")
-versions_df = pd.read_csv("data/csv/versions.csv")
-languages_df = pd.read_csv("data/csv/languages.csv")
-pokemon_species_names_df = pd.read_csv("data/csv/pokemon_species_names.csv") # for localized names
+def _resolve_pokemon_species_id(identifier):
+    # species id for a pokemon id (10034, "10034") or a pokemon name ("charizard-mega-x")
+    pokemon_id = _to_id(identifier, _data.POKEMON_NAME_TO_ID)
+    if pokemon_id not in _data.POKEMON_BY_ID.index:
+        raise ValueError(f"Pokémon '{identifier}' not found")
+    return int(_data.POKEMON_BY_ID.at[pokemon_id, "species_id"])
 
-class typed_function:
 
-    '''
-    pokemon_df = pd.read_csv("data/csv/pokemon.csv")
-    pokemon_evolution_df = pd.read_csv("data/csv/pokemon_evolution.csv")
-    pokemon_types_df = pd.read_csv("data/csv/pokemon_types.csv")
-    types_df = pd.read_csv("data/csv/types.csv")
+# The tables never change after import, so results are memoized per canonical key
+@functools.lru_cache(maxsize=4096)
+def _get_pokemon_cached(species_id, form, language_id):
+    # get_pokemon for a canonical species id; results are shared, don't mutate them
+    # the default pokemon of a species shares its id
+    pokemon_id = _data.POKEMON_NAME_TO_ID[form] if form is not None else species_id
+    # scalar .at reads: no per-call row Series
+    pokemon_dexNum = int(_data.POKEMON_BY_ID.at[pokemon_id, "species_id"])
 
-    dexNum = 25
+    pokemon_types_list = [int(t) for t in _data.TYPES_BY_POKEMON.get(pokemon_id, ())]
 
-    pokemonListSearch = pokemon_df[pokemon_df["species_id"] == dexNum]
-    print(pokemonListSearch)
-    '''
+    stats_row = _data.STATS_MATRIX[_data.POKEMON_ID_TO_ROW[pokemon_id]].tolist()
 
+    evolution_chain_id = int(_data.SPECIES_BY_ID.at[pokemon_dexNum, "evolution_chain_id"])
 
-    @staticmethod
-    def get_pokemon(identifier, form=None, language_id=9):
-        # identifier can be DexNum (25) or name ("pikachu")
+    # evolution chain in evolution order (precomputed)
+    evolution_chain_id_list = _data.EVO_ORDER_BY_CHAIN[evolution_chain_id]
 
-        if isinstance(identifier, str):
-            try:
-                dex = int(identifier)
-                pokemon = pokemon_species_df[pokemon_species_df["id"] == dex]
-            except ValueError:
-                pokemon = pokemon_species_df[pokemon_species_df["identifier"].str.lower() == identifier.lower()]
-        else:
-            pokemon = pokemon_species_df[pokemon_species_df["id"] == identifier]
-            dex = pokemon["id"].values[0] if not pokemon.empty else None
-
-        if pokemon.empty:
-            raise ValueError(f"Pokémon '{identifier}' not found")
-
-        if form is not None:
-            pokemon = pokemon_df[pokemon_df["identifier"].str.lower() == form]
-            if pokemon.empty:
-                raise ValueError(f"Pokémon '{identifier}' with form '{form}' not found")
-
-        p = pokemon.iloc[0]
-        p = pokemon_df[pokemon_df["id"] == p["id"]].iloc[0]
-        pokemon_id = p["id"]
-        pokemon_dexNum = p["species_id"]
-
-        pokemon_types_list = pokemon_types_df[pokemon_types_df["pokemon_id"] == pokemon_id]["type_id"].tolist()
-        type_names = ", ".join(types_df[types_df["id"].isin(pokemon_types_list)]["identifier"].tolist())
-
-        stats_list = pokemon_stats_df[pokemon_stats_df["pokemon_id"] == pokemon_id][["stat_id", "base_stat"]]
-
-        evolution_chain_id = pokemon_species_df[pokemon_species_df["id"] == pokemon_dexNum]["evolution_chain_id"].values[0]
-        evolution_chain = pokemon_species_df[pokemon_species_df["evolution_chain_id"] == evolution_chain_id]
-
-        # sort evolution chain by evolution order
-        start_row = evolution_chain[evolution_chain["evolves_from_species_id"].isna()].sort_values("id").iloc[0]
-        current_id = start_row["id"]
-
-        order = [current_id]
-
-        current_ids = [current_id]
-
-        for current_id in current_ids:
-            next_rows = evolution_chain[evolution_chain["evolves_from_species_id"] == current_id].sort_values("id")
-            if next_rows.empty:
-                continue
-            
-            for k in range(len(next_rows)):
-                order.append(next_rows.iloc[k]["id"])
-            current_ids.extend(next_rows["id"].tolist())
-
-
-
-        evolution_chain_sorted = evolution_chain.set_index("id").loc[order].reset_index()
-        ###
-
-        evolution_chain_id_list = evolution_chain_sorted["id"].tolist()
-
-        pokemon_evolution_line_list = []
-        for pid in evolution_chain_id_list:
-            pok = pokemon_df[pokemon_df["id"] == pid]
-            if not pok.empty:
-                name = pokemon_species_names_df[(pokemon_species_names_df["pokemon_species_id"] == pid)]
-                name = name[name["local_language_id"] == language_id]
-                if not name.empty:
-                    name = name["name"].values[0]
-                else:
-                    name = pok["identifier"].values[0]
-                pokemon_evolution_line_list.append({
-                    "name": name,
-                    "image": f"data/sprites/sprites/pokemon/{int(pid)}.png",
-                    "dex_number": pok["species_id"].values[0]
-                })
-
-
-
-
-
-
-        pokemon_forms_list = pokemon_df[pokemon_df["species_id"] == pokemon_dexNum]["identifier"].tolist()
-
-
-        pokemon_localized_name = pokemon_species_names_df[(pokemon_species_names_df["pokemon_species_id"] == pokemon_dexNum)]
-        pokemon_localized_name = pokemon_localized_name[pokemon_localized_name["local_language_id"] == language_id]
-
-        if not pokemon_localized_name.empty:
-            pokemon_localized_name = pokemon_localized_name["name"].values[0]
-        else:
-            pokemon_localized_name = p["identifier"].capitalize()
-        
-
-        return {
-            "name": pokemon_localized_name,
-            "dex_number": p["species_id"],
-            #"image": f"data/sprites/sprites/pokemon/{int(p['id'])}.png",
-            "image": f"data/sprites/sprites/pokemon/other/home/{int(p['id'])}.png",
-            "cries": [f"data/cries/cries/pokemon/latest/{int(p['id'])}.ogg"],
-            #"types": type_names.split(", "),
-            "types": pokemon_types_list,
-            "base_stats": {
-                "HP": stats_list[stats_list["stat_id"] == 1]["base_stat"].values[0],
-                "Atk": stats_list[stats_list["stat_id"] == 2]["base_stat"].values[0],
-                "Def": stats_list[stats_list["stat_id"] == 3]["base_stat"].values[0],
-                "SpA": stats_list[stats_list["stat_id"] == 4]["base_stat"].values[0],
-                "SpD": stats_list[stats_list["stat_id"] == 5]["base_stat"].values[0],
-                "Spe": stats_list[stats_list["stat_id"] == 6]["base_stat"].values[0]
-            },
-            "evolution_line": pokemon_evolution_line_list,
-            "forms": pokemon_forms_list,
-        }
+    names = _data.NAME_BY_LANG.get(language_id, {})
 
-    @staticmethod
-    def get_available_forms(identifier):
+    # one batched lookup for the whole line; ids missing from pokemon_df come back as NaN rows
+    evolution_rows = _data.POKEMON_BY_ID.reindex(evolution_chain_id_list)
+    pokemon_evolution_line_list = [
+        {
+            "name": names.get(pid, identifier),
+            "image": _data.SPRITE_PATH[pid],
+            "dex_number": int(dex_number),
+        }
+        for pid, identifier, dex_number in zip(
+            evolution_chain_id_list,
+            evolution_rows["identifier"].to_numpy(),
+            evolution_rows["species_id"].to_numpy(),
+        )
+        if not math.isnan(dex_number)
+    ]
 
-        if isinstance(identifier, str):
-            try:
-                dex = int(identifier)
-                pokemon = pokemon_species_df[pokemon_species_df["id"] == dex]
-            except ValueError:
-                pokemon = pokemon_species_df[pokemon_species_df["identifier"].str.lower() == identifier.lower()]
-        else:
-            pokemon = pokemon_species_df[pokemon_species_df["id"] == identifier]
-            dex = pokemon["id"].values[0] if not pokemon.empty else None
+    pokemon_forms_list = list(_data.FORMS_BY_SPECIES.get(pokemon_dexNum, ()))
 
-        if pokemon.empty:
-            raise ValueError(f"Pokémon '{identifier}' not found")
 
+    pokemon_localized_name = names.get(pokemon_dexNum)
+    if pokemon_localized_name is None:
+        pokemon_localized_name = str(_data.POKEMON_BY_ID.at[pokemon_id, "identifier"]).capitalize()
 
-        p = pokemon.iloc[0]
-        p = pokemon_df[pokemon_df["id"] == p["id"]].iloc[0]
+    return {
+        "name": pokemon_localized_name,
+        "dex_number": pokemon_dexNum,
+        #"image": f"data/sprites/sprites/pokemon/{int(pokemon_id)}.png",
+        "image": _data.HOME_SPRITE_PATH[pokemon_id],
+        "cries": [_data.CRY_PATH[pokemon_id]],
+        "types": pokemon_types_list,  # ids: the UI picks the icon by id
+        "base_stats": dict(zip(_data.STAT_KEYS, stats_row)),
+        "evolution_line": pokemon_evolution_line_list,
+        "forms": pokemon_forms_list,
+    }
 
-        pokemon_dexNum = p["species_id"]
-        pokemon_forms_list = pokemon_df[pokemon_df["species_id"] == pokemon_dexNum]["identifier"].tolist()
-        return pokemon_forms_list
-    
 
-    @staticmethod
-    def get_pokedex_flavor(identifier, language_id=9):
-
-
-        if isinstance(identifier, str):
-            try:
-                id = int(identifier)
-                pokemon = pokemon_df[pokemon_df["id"] == id]
-            except ValueError:
-                pokemon = pokemon_df[pokemon_df["identifier"].str.lower() == identifier.lower()]
-        else:
-            pokemon = pokemon_df[pokemon_df["id"] == identifier]
-            dex = pokemon["id"].values[0] if not pokemon.empty else None
+@functools.lru_cache(maxsize=4096)
+def _get_pokedex_flavor_cached(pokemon_dexNum, language_id):
+    version_ids, flavor_texts = _data.FLAVOR_BY_LANG_SPECIES.get((language_id, pokemon_dexNum), ((), ()))
 
-        if pokemon.empty:
-            raise ValueError(f"Pokémon '{identifier}' not found")
+    # one version per text, so the two lists always pair up
+    versions_list = [_data.VERSION_NAME_BY_ID[v] for v in version_ids]
+    flavor_texts_list = list(flavor_texts)
 
 
-        p = pokemon.iloc[0]
-        p = pokemon_df[pokemon_df["id"] == p["id"]].iloc[0]
-        pokemon_dexNum = p["species_id"]
+    return {
+        "versions": versions_list,
+        "flavor_texts": flavor_texts_list
+    }
 
 
-        flavor_dataframe = pokemon_species_flavor_text_df[pokemon_species_flavor_text_df["language_id"] == language_id]
-        flavor_dataframe = flavor_dataframe[flavor_dataframe["species_id"] == pokemon_dexNum]
-
-
-        versions_list = versions_df[versions_df["id"].isin(flavor_dataframe["version_id"].values.tolist())]["identifier"].tolist()
-        flavor_texts_list = flavor_dataframe["flavor_text"].values.tolist()
-
+class typed_function:
 
-        return {
-            "versions": versions_list,
-            "flavor_texts": flavor_texts_list
-        }
+    @staticmethod
+    def get_pokemon(identifier, form=None, language_id=9):
+        # identifier can be DexNum (25) or name ("pikachu")
+        species_id = _resolve_species_id(identifier)
+        if form is not None and form not in _data.POKEMON_NAME_TO_ID:
+            raise ValueError(f"Pokémon '{identifier}' with form '{form}' not found")
+        # shallow copy so callers can't replace keys of the cached dict
+        return dict(_get_pokemon_cached(species_id, form, int(language_id)))
 
+    @staticmethod
+    def get_pokemon_many(identifiers, language_id=9):
+        # batched get_pokemon: {identifier: data}; unknown identifiers are left out
+        # (a plain loop: the lookups hold the GIL, so threads wouldn't make it faster)
+        results = {}
+        for identifier in dict.fromkeys(identifiers):
+            try:
+                results[identifier] = typed_function.get_pokemon(identifier, language_id=language_id)
+            except (ValueError, IndexError, KeyError):
+                pass
+        return results
 
+    @staticmethod
+    def get_available_forms(identifier):
+        return list(_data.FORMS_BY_SPECIES.get(_resolve_species_id(identifier), ()))
 
+    @staticmethod
+    def get_pokedex_flavor(identifier, language_id=9):
+        # unlike get_pokemon, numbers and names here are pokemon ids/identifiers (forms included)
+        species_id = _resolve_pokemon_species_id(identifier)
+        return dict(_get_pokedex_flavor_cached(species_id, int(language_id)))
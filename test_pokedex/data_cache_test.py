@@ -0,0 +1,32 @@
+import pandas as pd
+
+from pokedex import data_cache
+
+
+def test_load_writes_and_reuses_parquet_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_cache, "CSV_DIR", tmp_path / "csv")
+    monkeypatch.setattr(data_cache, "CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "csv").mkdir()
+    (tmp_path / "csv" / "languages.csv").write_text("id,identifier,official\n9,en,1\n1,ja-hrkt,1\n")
+
+    first = data_cache.load("languages")
+    assert (tmp_path / "cache" / "languages.parquet").exists()
+
+    (tmp_path / "csv" / "languages.csv").unlink()  # second load must come from the cache
+    second = data_cache.load("languages", columns=["id", "official"])
+    pd.testing.assert_frame_equal(second, first[["id", "official"]])
+
+
+def test_load_keeps_dtypes_through_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_cache, "CSV_DIR", tmp_path / "csv")
+    monkeypatch.setattr(data_cache, "CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "csv").mkdir()
+    (tmp_path / "csv" / "languages.csv").write_text("id,identifier,official\n9,en,1\n1,ja-hrkt,1\n")
+    dtype = {"id": "int16", "identifier": "string[pyarrow]", "official": "int8"}
+
+    data_cache.load("languages", dtype=dtype)
+    (tmp_path / "csv" / "languages.csv").unlink()
+    cached = data_cache.load("languages", dtype=dtype)
+
+    assert cached.dtypes.astype(str).to_dict() == {"id": "int16", "identifier": "string", "official": "int8"}
+    assert cached["identifier"].tolist() == ["en", "ja-hrkt"]
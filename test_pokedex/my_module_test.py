@@ -0,0 +1,68 @@
+import pytest
+
+from pokedex import _data, data_cache, my_module
+from pokedex.my_module import typed_function
+
+CSVS = {
+    "pokemon": "id,identifier,species_id,is_default\n1,bulbasaur,1,1\n2,ivysaur,2,1\n10033,ivysaur-mega,2,0\n",
+    "pokemon_species": "id,identifier,evolves_from_species_id,evolution_chain_id\n1,bulbasaur,,1\n2,ivysaur,1,1\n",
+    "pokemon_types": "pokemon_id,type_id,slot\n1,12,1\n1,4,2\n2,12,1\n10033,12,1\n",
+    "pokemon_stats": "pokemon_id,stat_id,base_stat\n"
+    + "".join(
+        f"{pid},{stat_id},{10 * stat_id}\n"
+        for pid in (1, 2, 10033)
+        for stat_id in range(1, 7)
+    ),
+    "pokemon_species_flavor_text": (
+        "species_id,version_id,language_id,flavor_text\n"
+        "1,1,9,Red text\n1,1,5,Texte rouge\n1,2,9,Blue text\n2,2,9,Ivysaur text\n"
+    ),
+    "versions": "id,version_group_id,identifier\n1,1,red\n2,1,blue\n",
+    "pokemon_species_names": "pokemon_species_id,local_language_id,name\n1,9,Bulbasaur\n2,9,Ivysaur\n",
+}
+
+
+def _reset():
+    _data._load.cache_clear()
+    my_module._get_pokemon_cached.cache_clear()
+    my_module._get_pokedex_flavor_cached.cache_clear()
+
+
+@pytest.fixture
+def tiny_tables(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_cache, "CSV_DIR", tmp_path / "csv")
+    monkeypatch.setattr(data_cache, "CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "csv").mkdir()
+    for name, text in CSVS.items():
+        (tmp_path / "csv" / f"{name}.csv").write_text(text)
+    for name in _data._LAZY_NAMES:  # tables already loaded by another test
+        monkeypatch.delattr(_data, name, raising=False)
+    _reset()
+    yield
+    _reset()
+
+
+def test_get_pokedex_flavor_pairs_versions_and_texts(tiny_tables):
+    flavor = typed_function.get_pokedex_flavor("bulbasaur", language_id=9)
+
+    assert flavor == {
+        "versions": ["red", "blue"],
+        "flavor_texts": ["Red text", "Blue text"],
+    }
+    assert typed_function.get_pokedex_flavor(1, language_id=5) == {
+        "versions": ["red"],
+        "flavor_texts": ["Texte rouge"],
+    }
+    # pokemon identifiers of alternate forms resolve to their species
+    assert typed_function.get_pokedex_flavor("ivysaur-mega")["flavor_texts"] == [
+        "Ivysaur text"
+    ]
+
+
+def test_get_pokemon_many_skips_unknown_identifiers(tiny_tables):
+    many = typed_function.get_pokemon_many(["bulbasaur", "nope", 2, "bulbasaur"])
+
+    assert list(many) == ["bulbasaur", 2]
+    assert many["bulbasaur"] == typed_function.get_pokemon("bulbasaur")
+    assert many[2]["name"] == "Ivysaur"
+    assert [n["name"] for n in many[2]["evolution_line"]] == ["Bulbasaur", "Ivysaur"]